@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-09-01 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_song_acousticness_alter_song_danceability_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(fields=['-rating', 'title'], name='song_rating_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(fields=['title'], name='song_title_idx'),
+        ),
+    ]
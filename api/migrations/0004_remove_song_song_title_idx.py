@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-09-01 21:29
+
+from django.db import migrations
+
+
+def create_title_trigram_index(apps, schema_editor):
+    # icontains compiles to UPPER(title) LIKE UPPER('%x%') on PostgreSQL;
+    # only a trigram GIN index over upper(title) can serve that. No-op on
+    # other vendors (the default SQLite setup included).
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS song_title_trgm "
+        "ON api_song USING gin (upper(title) gin_trgm_ops)"
+    )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS song_title_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_song_song_rating_title_idx_song_song_title_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='song',
+            name='song_title_idx',
+        ),
+        migrations.RunPython(create_title_trigram_index, drop_title_trigram_index),
+    ]
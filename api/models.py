@@ -1,5 +1,29 @@
 from django.db import models
 
+VALIDATION_RULES = {
+    'rating': {'min': 1, 'max': 5, 'message': 'Rating must be between 1 and 5'},
+    'duration_ms': {'min': 0, 'message': 'Duration must be positive'},
+    'tempo': {'min': 0, 'max': 300, 'message': 'Tempo must be between 0 and 300 BPM'},
+    'loudness': {'min': -60, 'max': 0, 'message': 'Loudness must be between -60 and 0 dB'},
+    'danceability': {'min': 0.0, 'max': 1.0, 'message': 'Danceability must be between 0.0 and 1.0'},
+    'energy': {'min': 0.0, 'max': 1.0, 'message': 'Energy must be between 0.0 and 1.0'},
+    'acousticness': {'min': 0.0, 'max': 1.0, 'message': 'Acousticness must be between 0.0 and 1.0'},
+    'instrumentalness': {'min': 0.0, 'max': 1.0, 'message': 'Instrumentalness must be between 0.0 and 1.0'},
+    'liveness': {'min': 0.0, 'max': 1.0, 'message': 'Liveness must be between 0.0 and 1.0'},
+    'valence': {'min': 0.0, 'max': 1.0, 'message': 'Valence must be between 0.0 and 1.0'},
+}
+
+def _make_validator(rule):
+    lower = rule.get('min')
+    upper = rule.get('max')
+
+    def _validate(value, lower=lower, upper=upper):
+        return value is None or ((lower is None or value >= lower) and (upper is None or value <= upper))
+
+    return _validate
+
+_VALIDATORS = {field: _make_validator(rule) for field, rule in VALIDATION_RULES.items()}
+
 class Song(models.Model):
  
     song_id = models.CharField(max_length=255, primary_key=True)
@@ -23,8 +47,11 @@ class Song(models.Model):
     valence = models.FloatField()
 
     class Meta:
- 
+
         ordering = ['-rating', 'title']
+        indexes = [
+            models.Index(fields=['-rating', 'title'], name='song_rating_title_idx'),
+        ]
 
     def __str__(self):
  
@@ -32,7 +59,8 @@ class Song(models.Model):
 
     def save(self, *args, **kwargs):
 
-        if self.rating is not None and not (1 <= self.rating <= 5):
-            raise ValueError("Rating must be between 1 and 5.")
+        for field_name, validator in _VALIDATORS.items():
+            if not validator(getattr(self, field_name, None)):
+                raise ValueError(f"{VALIDATION_RULES[field_name]['message']}.")
         super().save(*args, **kwargs)
 
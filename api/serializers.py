@@ -5,6 +5,11 @@ class SongSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Song
- 
+
         fields = '__all__'
- 
+
+_SONG_FIELD_NAMES = [field.name for field in Song._meta.concrete_fields]
+
+_src = "def _song_to_dict(o): return {" + ", ".join(f"{name!r}: o.{name}" for name in _SONG_FIELD_NAMES) + "}"
+exec(_src, globals())
+
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .models import Song
+
+
+@shared_task
+def rebuild_song_cache():
+
+    from .views import cache_all_songs_sorted
+
+    cache_all_songs_sorted(Song.objects.all().order_by('-rating'))
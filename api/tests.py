@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from . import views
+from .models import Song
+from .views import FIELD_DEFAULTS
+
+
+def _song_kwargs(**overrides):
+    kwargs = dict(FIELD_DEFAULTS)
+    kwargs.update(overrides)
+    return kwargs
+
+
+class SongListQueryBudgetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(15):
+            Song.objects.create(song_id=f"song-{i}", **_song_kwargs(title=f"Song {i}", rating=(i % 5) + 1))
+
+    def setUp(self):
+        cache.clear()
+        # The budgets below pin the DB path; patch out the module-level
+        # client so a reachable Redis can't serve (or get polluted by) these requests.
+        patcher = mock.patch.object(views, 'redis_client', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list_cache_miss_query_budget(self):
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/songs/?page=1&limit=10')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 10)
+
+    def test_list_response_is_memoized(self):
+
+        first = self.client.get('/api/songs/?page=1&limit=10')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/songs/?page=1&limit=10')
+        self.assertEqual(second.json(), first.json())
+
+
+class SongSearchQueryBudgetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Song.objects.create(song_id="song-search", **_song_kwargs(title="4 Walls", rating=5))
+
+    def test_search_query_budget(self):
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/songs/search/?title=4 Walls')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['total_results'], 1)
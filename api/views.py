@@ -1,32 +1,37 @@
+import csv
+import io
 import os
 import json
 import logging
 import re
 from typing import Dict, Any, List, Optional, Tuple
 
-from django.db import transaction
+import lz4.frame
+import msgspec
+import orjson
+
+from django.db import connection, transaction
 from django.db.models import F
 from django.db import IntegrityError
 from django.core.exceptions import ValidationError
 from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param, remove_query_param
 from rest_framework import generics
 from rest_framework.parsers import MultiPartParser, FormParser # For file uploads
 from rest_framework.status import HTTP_429_TOO_MANY_REQUESTS
 import redis
 from redis.exceptions import ConnectionError as RedisConnectionError
 
-from .models import Song
-from .serializers import SongSerializer
+from .models import Song, VALIDATION_RULES, _VALIDATORS
+from .serializers import SongSerializer, _song_to_dict
 
-logging.basicConfig(
-    level=logging.INFO, 
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -51,18 +56,49 @@ FIELD_DEFAULTS = {
     'rating': None,
 }
 
-VALIDATION_RULES = {
-    'rating': {'min': 1, 'max': 5, 'message': 'Rating must be between 1 and 5'},
-    'duration_ms': {'min': 0, 'message': 'Duration must be positive'},
-    'tempo': {'min': 0, 'max': 300, 'message': 'Tempo must be between 0 and 300 BPM'},
-    'loudness': {'min': -60, 'max': 0, 'message': 'Loudness must be between -60 and 0 dB'},
-    'danceability': {'min': 0.0, 'max': 1.0, 'message': 'Danceability must be between 0.0 and 1.0'},
-    'energy': {'min': 0.0, 'max': 1.0, 'message': 'Energy must be between 0.0 and 1.0'},
-    'acousticness': {'min': 0.0, 'max': 1.0, 'message': 'Acousticness must be between 0.0 and 1.0'},
-    'instrumentalness': {'min': 0.0, 'max': 1.0, 'message': 'Instrumentalness must be between 0.0 and 1.0'},
-    'liveness': {'min': 0.0, 'max': 1.0, 'message': 'Liveness must be between 0.0 and 1.0'},
-    'valence': {'min': 0.0, 'max': 1.0, 'message': 'Valence must be between 0.0 and 1.0'},
-}
+_INTEGER_FIELDS = ['duration_ms', 'num_sections', 'num_segments', 'key',
+                   'mode', 'time_signature', 'num_bars', 'song_class']
+
+_FLOAT_FIELDS = ['danceability', 'energy', 'acousticness', 'tempo',
+                 'loudness', 'instrumentalness', 'liveness', 'valence']
+
+COERCIONS = {name: (int, FIELD_DEFAULTS.get(name, 0)) for name in _INTEGER_FIELDS}
+COERCIONS.update({name: (float, FIELD_DEFAULTS.get(name, 0.0)) for name in _FLOAT_FIELDS})
+
+def _safe_cast(value, cast):
+    try:
+        return cast(value)
+    except (ValueError, TypeError):
+        return None
+
+class SongIn(msgspec.Struct):
+
+    song_id: str
+    title: str = FIELD_DEFAULTS['title']
+    rating: Optional[int] = FIELD_DEFAULTS['rating']
+    duration_ms: int = FIELD_DEFAULTS['duration_ms']
+    num_sections: int = FIELD_DEFAULTS['num_sections']
+    num_segments: int = FIELD_DEFAULTS['num_segments']
+    key: int = FIELD_DEFAULTS['key']
+    mode: int = FIELD_DEFAULTS['mode']
+    time_signature: int = FIELD_DEFAULTS['time_signature']
+    num_bars: int = FIELD_DEFAULTS['num_bars']
+    song_class: int = FIELD_DEFAULTS['song_class']
+    danceability: float = FIELD_DEFAULTS['danceability']
+    energy: float = FIELD_DEFAULTS['energy']
+    acousticness: float = FIELD_DEFAULTS['acousticness']
+    tempo: float = FIELD_DEFAULTS['tempo']
+    loudness: float = FIELD_DEFAULTS['loudness']
+    instrumentalness: float = FIELD_DEFAULTS['instrumentalness']
+    liveness: float = FIELD_DEFAULTS['liveness']
+    valence: float = FIELD_DEFAULTS['valence']
+
+_SONG_FIELDS = [
+    'song_id', 'title', 'danceability', 'energy', 'acousticness', 'tempo',
+    'duration_ms', 'num_sections', 'num_segments', 'rating', 'key', 'loudness',
+    'mode', 'time_signature', 'num_bars', 'song_class', 'instrumentalness',
+    'liveness', 'valence',
+]
 
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
@@ -72,56 +108,86 @@ REDIS_DB = int(os.environ.get('REDIS_DB', 0))
 
 redis_client = None
 try:
-    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB, decode_responses=True)
+    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB, decode_responses=False)
     redis_client.ping()
-    logging.info(f"Successfully connected to Redis at {REDIS_HOST}:{REDIS_PORT}.")
+    logger.info("Successfully connected to Redis at %s:%s.", REDIS_HOST, REDIS_PORT)
 except RedisConnectionError as e:
-    logging.warning(f"Could not connect to Redis at {REDIS_HOST}:{REDIS_PORT}: {e}. Running without Redis cache.")
+    logger.warning("Could not connect to Redis at %s:%s: %s. Running without Redis cache.", REDIS_HOST, REDIS_PORT, e)
     redis_client = None
- 
+
+_RATE_LIMIT_LUA = """
+local attempts = redis.call('INCR', KEYS[1])
+if attempts == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return attempts
+"""
+
+_rate_limit_script = redis_client.register_script(_RATE_LIMIT_LUA) if redis_client else None
+
+def _increment_rate_limit(user_key, window_seconds=60):
+    if _rate_limit_script:
+        try:
+            return _rate_limit_script(keys=[user_key], args=[window_seconds])
+        except Exception as e:
+            logger.error("Error applying Redis rate limit for %s: %s", user_key, e)
+
+    current_attempts = cache.get(user_key, 0) + 1
+    cache.set(user_key, current_attempts, window_seconds)
+    return current_attempts
+
 class StandardResultsPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'limit'
     max_page_size = 100
 
-def cache_all_songs_sorted(songs_queryset):
-    if not redis_client:
-        return
+_SONG_KEY_PREFIX = "song2:"
 
-    try:
-        pipeline = redis_client.pipeline()
-        pipeline.delete("songs_by_rating")
+def _pack_song(song_data):
+    return lz4.frame.compress(orjson.dumps(song_data))
 
-        for song in songs_queryset:
-            serializer = SongSerializer(song)
-            song_data = serializer.data
-            song_id = song_data["song_id"]
-            rating_score = song_data.get("rating") if song_data.get("rating") is not None else 0
+def _unpack_song(raw_payload):
+    return orjson.loads(lz4.frame.decompress(raw_payload))
 
-            pipeline.set(f"song:{song_id}", json.dumps(song_data))
-            pipeline.zadd("songs_by_rating", {song_id: rating_score})
-        pipeline.execute()
-        logging.info(f"Cached {len(songs_queryset)} songs in Redis sorted set 'songs_by_rating'.")
-    except Exception as e:
-        logging.error(f"Error caching all songs in Redis: {e}")
+def _flush_song_cache_bucket(mapping, scores):
+    pipeline = redis_client.pipeline()
+    pipeline.mset(mapping)
+    pipeline.zadd("songs_by_rating", scores)
+    pipeline.execute()
 
-def get_cached_all_songs_sorted():
+def cache_all_songs_sorted(songs_queryset, bucket_size=5000):
     if not redis_client:
         return None
+
     try:
-        song_ids = redis_client.zrevrange("songs_by_rating", 0, -1)
-        if not song_ids:
-            return None
+        rows = songs_queryset.values(*_SONG_FIELDS).iterator(chunk_size=2000)
+
+        redis_client.delete("songs_by_rating")
+
+        cached_count = 0
+        mapping = {}
+        scores = {}
+        for song_data in rows:
+            song_id = song_data["song_id"]
+            rating_score = song_data["rating"] if song_data["rating"] is not None else 0
+
+            mapping[f"{_SONG_KEY_PREFIX}{song_id}"] = _pack_song(song_data)
+            scores[song_id] = rating_score
 
-        cached_songs_data = []
-        for song_id in song_ids:
-            song_data_str = redis_client.get(f"song:{song_id}")
-            if song_data_str:
-                cached_songs_data.append(json.loads(song_data_str))
-        logging.info(f"Fetched {len(cached_songs_data)} songs from Redis cache.")
-        return cached_songs_data
+            if len(mapping) >= bucket_size:
+                _flush_song_cache_bucket(mapping, scores)
+                cached_count += len(mapping)
+                mapping = {}
+                scores = {}
+
+        if mapping:
+            _flush_song_cache_bucket(mapping, scores)
+            cached_count += len(mapping)
+
+        logger.info("Cached %d songs in Redis sorted set 'songs_by_rating'.", cached_count)
+        return cached_count
     except Exception as e:
-        logging.error(f"Error retrieving cached songs from Redis: {e}")
+        logger.error("Error caching all songs in Redis: %s", e)
         return None
 
 def update_song_cache(song_instance):
@@ -129,16 +195,68 @@ def update_song_cache(song_instance):
         return
 
     try:
-        serializer = SongSerializer(song_instance)
-        song_data = serializer.data
+        song_data = _song_to_dict(song_instance)
         song_id = song_data["song_id"]
         rating_score = song_data.get("rating") if song_data.get("rating") is not None else 0
 
-        redis_client.set(f"song:{song_id}", json.dumps(song_data))
+        redis_client.set(f"{_SONG_KEY_PREFIX}{song_id}", _pack_song(song_data))
         redis_client.zadd("songs_by_rating", {song_id: rating_score})
-        logging.info(f"Updated cache for song_id: {song_id} with new rating: {rating_score}.")
+        logger.info("Updated cache for song_id: %s with new rating: %s.", song_id, rating_score)
     except Exception as e:
-        logging.error(f"Error updating song cache for {song_instance.song_id}: {e}")
+        logger.error("Error updating song cache for %s: %s", song_instance.song_id, e)
+
+def update_songs_cache_bulk(song_dicts):
+    if not redis_client:
+        return
+
+    try:
+        if not redis_client.zcard("songs_by_rating"):
+            # Seeding an empty/flushed cache with only the changed ids would
+            # make the list view serve a partial sorted set; rebuild it in full.
+            cache_all_songs_sorted(Song.objects.all().order_by('-rating'))
+            return
+
+        mapping = {}
+        scores = {}
+        for song_data in song_dicts:
+            song_id = song_data["song_id"]
+            rating_score = song_data["rating"] if song_data["rating"] is not None else 0
+
+            mapping[f"{_SONG_KEY_PREFIX}{song_id}"] = _pack_song(song_data)
+            scores[song_id] = rating_score
+
+        if mapping:
+            _flush_song_cache_bucket(mapping, scores)
+        logger.info("Updated cache for %d songs from bulk upsert.", len(mapping))
+    except Exception as e:
+        logger.error("Error updating song cache in bulk: %s", e)
+
+def _pg_copy_upsert(validated_songs):
+
+    with connection.cursor() as cursor:
+        if not hasattr(cursor, 'copy_expert'):
+            # copy_expert is psycopg2-only; on psycopg 3 let the caller
+            # fall back to the ORM bulk path instead of failing the upload.
+            return False
+
+        columns = _SONG_FIELDS
+        column_sql = ', '.join(columns)
+        update_sql = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns if column != 'song_id')
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for song_data in validated_songs.values():
+            writer.writerow(['' if song_data[column] is None else song_data[column] for column in columns])
+        buffer.seek(0)
+
+        cursor.execute("CREATE TEMPORARY TABLE api_song_staging (LIKE api_song INCLUDING DEFAULTS) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY api_song_staging ({column_sql}) FROM STDIN WITH CSV", buffer)
+        cursor.execute(
+            f"INSERT INTO api_song ({column_sql}) "
+            f"SELECT {column_sql} FROM api_song_staging "
+            f"ON CONFLICT (song_id) DO UPDATE SET {update_sql}"
+        )
+    return True
 
 def _normalize_column_oriented_json_data(data_dict):
  
@@ -166,66 +284,121 @@ def _normalize_column_oriented_json_data(data_dict):
         "valence": "valence",
     }
 
-    for i in range(num_songs):
-        song_record = {}
-        idx_str = str(i)  
+    idx_strs = [str(i) for i in range(num_songs)]
+
+    columns = {}
+    for json_key, model_field in json_to_model_map.items():
+        sub_dict = data_dict.get(json_key, {})
+        columns[model_field] = [sub_dict.get(idx_str) for idx_str in idx_strs]
 
-        for json_key, model_field in json_to_model_map.items():
+    model_fields = list(columns.keys())
+
+    for i, row_values in enumerate(zip(*columns.values())):
+        song_record = {}
 
-            value = data_dict.get(json_key, {}).get(idx_str)
+        for model_field, value in zip(model_fields, row_values):
             if isinstance(value, str):
                 value = value.strip()
- 
+
             if value is None and model_field in FIELD_DEFAULTS:
                 value = FIELD_DEFAULTS[model_field]
-                logging.debug(f"Applied default '{value}' for missing/None field '{model_field}' at index {i}.")
 
             song_record[model_field] = value
 
         song_record['rating'] = FIELD_DEFAULTS.get('rating', None)
- 
+
         if not song_record.get("song_id") or not song_record.get("title"):
-            raw_song_data_for_index = {k: data_dict.get(k, {}).get(idx_str) for k in data_dict.keys()}
-            logging.warning(f"Skipping song at index {i} due to missing 'song_id' or 'title' after normalization. Raw data: {raw_song_data_for_index}")
-            continue  
+            if logger.isEnabledFor(logging.WARNING):
+                raw_song_data_for_index = {k: data_dict.get(k, {}).get(idx_strs[i]) for k in data_dict.keys()}
+                logger.warning("Skipping song at index %d due to missing 'song_id' or 'title' after normalization. Raw data: %s", i, raw_song_data_for_index)
+            continue
 
         normalized_records.append(song_record)
     return normalized_records
 
 
 # --- API Endpoints ---
+@method_decorator(cache_page(30), name='get')
 class SongListAPIView(APIView):
  
     pagination_class = StandardResultsPagination
 
-    def get(self, request, *args, **kwargs):
+    def _get_page_params(self, request):
         try:
-            paginator = self.pagination_class()
-            songs_data = get_cached_all_songs_sorted()
+            page = max(int(request.query_params.get('page', 1)), 1)
+        except (ValueError, TypeError):
+            page = 1
 
-            if songs_data:
-                logging.info("Serving songs from Redis cache.")
-                paginated_songs = paginator.paginate_queryset(songs_data, request)
-                return paginator.get_paginated_response(paginated_songs)
+        try:
+            limit = int(request.query_params.get('limit', self.pagination_class.page_size))
+        except (ValueError, TypeError):
+            limit = self.pagination_class.page_size
+        limit = min(max(limit, 1), self.pagination_class.max_page_size)
+
+        return page, limit
 
+    def _cached_page_response(self, request, page, limit):
+        if not redis_client:
+            return None
+        try:
+            total_songs = redis_client.zcard("songs_by_rating")
+            if not total_songs:
+                return None
+
+            start = (page - 1) * limit
+            end = start + limit - 1
+            if start >= total_songs:
+                return Response({"detail": "Invalid page."}, status=status.HTTP_404_NOT_FOUND)
+            song_ids = redis_client.zrevrange("songs_by_rating", start, end)
+
+            results = []
+            if song_ids:
+                raw_payloads = redis_client.mget([f"{_SONG_KEY_PREFIX}{song_id.decode()}" for song_id in song_ids])
+                results = [_unpack_song(raw) for raw in raw_payloads if raw]
+
+            url = request.build_absolute_uri()
+            next_url = replace_query_param(url, 'page', page + 1) if end + 1 < total_songs else None
+            if page <= 1:
+                previous_url = None
+            elif page == 2:
+                previous_url = remove_query_param(url, 'page')
             else:
-                logging.info("Fetching songs from database because redis cache missed.")
-                queryset = Song.objects.all().order_by('-rating')  
+                previous_url = replace_query_param(url, 'page', page - 1)
 
-                cache_all_songs_sorted(queryset)
-                songs_data_after_db_fetch = get_cached_all_songs_sorted()
+            return Response({
+                "count": total_songs,
+                "next": next_url,
+                "previous": previous_url,
+                "results": results,
+            })
+        except Exception as e:
+            logger.error("Error retrieving cached songs page from Redis: %s", e)
+            return None
+
+    def get(self, request, *args, **kwargs):
+        try:
+            page, limit = self._get_page_params(request)
+
+            cached_response = self._cached_page_response(request, page, limit)
+            if cached_response is not None:
+                logger.info("Serving songs from Redis cache.")
+                return cached_response
+
+            logger.info("Fetching songs from database because redis cache missed.")
+            queryset = Song.objects.all().order_by('-rating')
 
-                if songs_data_after_db_fetch:
-                    paginated_songs = paginator.paginate_queryset(songs_data_after_db_fetch, request)
-                    return paginator.get_paginated_response(paginated_songs)
-                else:
-                    logging.warning("Failed to retrieve from cache even after populating. Serving directly from DB queryset.")
-                    paginated_queryset = paginator.paginate_queryset(queryset, request)
-                    serializer = SongSerializer(paginated_queryset, many=True)
-                    return paginator.get_paginated_response(serializer.data)
+            if cache_all_songs_sorted(queryset):
+                cached_response = self._cached_page_response(request, page, limit)
+                if cached_response is not None:
+                    return cached_response
+
+            logger.warning("Failed to retrieve from cache even after populating. Serving directly from DB queryset.")
+            paginator = self.pagination_class()
+            paginated_queryset = paginator.paginate_queryset(queryset, request)
+            return paginator.get_paginated_response([_song_to_dict(song) for song in paginated_queryset])
 
         except Exception as e:
-            logging.error(f"Error retrieving songs: {e}", exc_info=True)
+            logger.error("Error retrieving songs: %s", e, exc_info=True)
             return Response({
                 "status": "error",
                 "data": {
@@ -268,18 +441,18 @@ class SongSearchAPIView(generics.ListAPIView):
                     }
                 }, status=status.HTTP_404_NOT_FOUND)
             
-            serializer = self.get_serializer(queryset, many=True)
+            results = [_song_to_dict(song) for song in queryset]
             return Response({
                 "status": "success",
                 "data": {
                     "search_term": title,
-                    "total_results": len(serializer.data),
-                    "results": serializer.data
+                    "total_results": len(results),
+                    "results": results
                 }
             })
             
         except Exception as e:
-            logging.error(f"Error during song search: {e}", exc_info=True)
+            logger.error("Error during song search: %s", e, exc_info=True)
             return Response({
                 "status": "error",
                 "data": {
@@ -303,18 +476,16 @@ class RateSongAPIView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             user_key = f"rate_limit_{request.user.id if hasattr(request, 'user') else 'anonymous'}_{song_id}"
-            current_attempts = cache.get(user_key, 0)
-            
-            if current_attempts >= 10:
+            current_attempts = _increment_rate_limit(user_key)
+
+            if current_attempts > 10:
                 return Response({
                     "status": "error",
                     "data": {
                         "message": "Rate limit exceeded. Please wait before rating this song again."
                     }
                 }, status=status.HTTP_429_TOO_MANY_REQUESTS)
-            
-            cache.set(user_key, current_attempts + 1, 60)   
-            
+
             rating = request.data.get('rating')
             
             if rating is None:
@@ -335,11 +506,11 @@ class RateSongAPIView(APIView):
                     }
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            if not (1 <= rating <= 5):
+            if not _VALIDATORS['rating'](rating):
                 return Response({
                     "status": "error",
                     "data": {
-                        "message": "Rating must be between 1 and 5"
+                        "message": VALIDATION_RULES['rating']['message']
                     }
                 }, status=status.HTTP_400_BAD_REQUEST)
 
@@ -351,10 +522,9 @@ class RateSongAPIView(APIView):
                     song.save()
 
                     update_song_cache(song)
-                    logging.info(f"Updated rating for song {song_id}: {old_rating} → {rating}")
+                    logger.info("Updated rating for song %s: %s → %s", song_id, old_rating, rating)
 
-                    serializer = SongSerializer(song)
-                    response_data = serializer.data
+                    response_data = _song_to_dict(song)
                     response_data.update({
                         "rating_change": f"{old_rating} → {rating}" if old_rating is not None else f"None → {rating}",
                         "song_id": song_id
@@ -381,7 +551,7 @@ class RateSongAPIView(APIView):
                     }, status=status.HTTP_400_BAD_REQUEST)
                 
         except Exception as e:
-            logging.error(f"Error rating song {song_id}: {e}", exc_info=True)
+            logger.error("Error rating song %s: %s", song_id, e, exc_info=True)
             return Response({
                 "status": "error",
                 "data": {
@@ -422,11 +592,11 @@ class JsonUploadAPIView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            raw_json_data = json.loads(uploaded_file.read())
+            raw_json_data = orjson.loads(uploaded_file.read())
             data_to_process = []
  
             if isinstance(raw_json_data, list) and len(raw_json_data) == 1 and isinstance(raw_json_data[0], dict) and 'id' in raw_json_data[0]:
-                logging.info("Detected list containing single column-oriented JSON object. Normalizing data.")
+                logger.info("Detected list containing single column-oriented JSON object. Normalizing data.")
                 data_to_process = _normalize_column_oriented_json_data(raw_json_data[0])
             else:
                 return Response({
@@ -439,90 +609,104 @@ class JsonUploadAPIView(APIView):
             processed_count = 0
             skipped_count = 0
             errors = []
+            validated_songs = {}
 
-            with transaction.atomic():
-                for index, song_data_raw in enumerate(data_to_process):
-                    try:
-                        song_data = song_data_raw.copy()
-
-                        if 'song_id' in song_data and isinstance(song_data['song_id'], str):
-                            song_data['song_id'] = song_data['song_id'].strip()
+            for index, song_data in enumerate(data_to_process):
+                try:
+                    if 'song_id' in song_data and isinstance(song_data['song_id'], str):
+                        song_data['song_id'] = song_data['song_id'].strip()
 
-                        integer_fields = ['duration_ms', 'num_sections', 'num_segments', 'key', 
-                                        'mode', 'time_signature', 'num_bars', 'song_class']
-                        
-                        for field_name in integer_fields:
-                            value = song_data.get(field_name)
-                            if value is None:
-                                song_data[field_name] = FIELD_DEFAULTS.get(field_name, 0)
-                            else:
-                                try:
-                                    song_data[field_name] = int(value)
-                                except (ValueError, TypeError):
-                                    logging.warning(f"Could not convert {field_name} ('{value}') to int for song {song_data.get('song_id', 'N/A')}. Using default.")
-                                    song_data[field_name] = FIELD_DEFAULTS.get(field_name, 0)
- 
-                        float_fields = ['danceability', 'energy', 'acousticness', 'tempo', 
-                                      'loudness', 'instrumentalness', 'liveness', 'valence']
-                        
-                        for field_name in float_fields:
+                    try:
+                        song_data = msgspec.structs.asdict(msgspec.convert(song_data, SongIn, strict=False))
+                    except msgspec.ValidationError:
+                        # Rows with junk values fall back to field-by-field coercion.
+                        for field_name, (cast, default) in COERCIONS.items():
                             value = song_data.get(field_name)
-                            if value is None:
-                                song_data[field_name] = FIELD_DEFAULTS.get(field_name, 0.0)
+                            if value is None or not isinstance(value, (int, float, str)):
+                                song_data[field_name] = default
                             else:
-                                try:
-                                    song_data[field_name] = float(value)
-                                except (ValueError, TypeError):
-                                    logging.warning(f"Could not convert {field_name} ('{value}') to float for song {song_data.get('song_id', 'N/A')}. Using default.")
-                                    song_data[field_name] = FIELD_DEFAULTS.get(field_name, 0.0)
-
-                        if ('title' not in song_data or 
-                            not isinstance(song_data['title'], str) or 
-                            not song_data['title'].strip()):
-                            song_data['title'] = "Untitled Song"
-                            logging.warning(f"Song at index {index + 1} has missing or invalid title. Using default.")
-
-                        if 'rating' not in song_data:
-                            song_data['rating'] = FIELD_DEFAULTS.get('rating', None)
-                        elif song_data['rating'] is not None:
-                            try:
-                                rating_value = int(song_data['rating'])
-                                if not (1 <= rating_value <= 5):
-                                    logging.warning(f"Invalid rating {rating_value} for song {song_data.get('song_id', 'N/A')}. Setting to None.")
-                                    song_data['rating'] = None
+                                cast_value = _safe_cast(value, cast)
+                                if cast_value is None:
+                                    logger.warning("Could not convert %s (%r) to %s for song %s. Using default.", field_name, value, cast.__name__, song_data.get('song_id', 'N/A'))
+                                    song_data[field_name] = default
                                 else:
-                                    song_data['rating'] = rating_value
-                            except (ValueError, TypeError):
-                                logging.warning(f"Could not convert rating to int for song {song_data.get('song_id', 'N/A')}. Setting to None.")
-                                song_data['rating'] = None
-
-                        logging.debug(f"Attempting to process song_id: '{song_data.get('song_id')}'")
-
-                        song, created = Song.objects.update_or_create(
-                            song_id=song_data['song_id'],
-                            defaults=song_data
-                        )
-                        
-                        processed_count += 1
-                        action = 'Created' if created else 'Updated'
-                        logging.info(f"{action} song: {song.title} ({song.song_id}) from JSON upload.")
-
-                    except IntegrityError as ie:
-                        skipped_count += 1
-                        song_id = song_data_raw.get('song_id', 'N/A')
-                        error_msg = f"Row {index + 1} (song_id: {song_id}): Integrity error - {ie}. This song ID might already exist or a NOT NULL field is missing."
-                        errors.append(error_msg)
-                        logging.warning(error_msg)
-
-                    except Exception as e:
-                        skipped_count += 1
-                        song_id = song_data_raw.get('song_id', 'N/A')
-                        error_msg = f"Row {index + 1} (song_id: {song_id}): Error processing - {e}"
-                        errors.append(error_msg)
-                        logging.error(f"Error processing row {index + 1} from JSON: {e}", exc_info=True)
-
-            logging.info("Re-caching all songs after JSON upload to ensure sorted list is fresh.")
-            cache_all_songs_sorted(Song.objects.all())
+                                    song_data[field_name] = cast_value
+
+                    for field_name, validator in _VALIDATORS.items():
+                        if field_name == 'rating':
+                            continue
+                        value = song_data.get(field_name)
+                        if not validator(value):
+                            rule = VALIDATION_RULES[field_name]
+                            if rule.get('min') is not None:
+                                value = max(value, rule['min'])
+                            if rule.get('max') is not None:
+                                value = min(value, rule['max'])
+                            logger.warning("Out-of-range %s (%r) for song %s. Clamping to %s.", field_name, song_data[field_name], song_data.get('song_id', 'N/A'), value)
+                            song_data[field_name] = value
+
+                    if ('title' not in song_data or
+                        not isinstance(song_data['title'], str) or
+                        not song_data['title'].strip()):
+                        song_data['title'] = "Untitled Song"
+                        logger.warning("Song at index %d has missing or invalid title. Using default.", index + 1)
+
+                    if 'rating' not in song_data:
+                        song_data['rating'] = FIELD_DEFAULTS.get('rating', None)
+                    elif song_data['rating'] is not None:
+                        rating_value = _safe_cast(song_data['rating'], int)
+                        if rating_value is None or not _VALIDATORS['rating'](rating_value):
+                            logger.warning("Invalid rating %r for song %s. Setting to None.", song_data['rating'], song_data.get('song_id', 'N/A'))
+                            song_data['rating'] = None
+                        else:
+                            song_data['rating'] = rating_value
+
+                    validated_songs[song_data['song_id']] = song_data
+                    processed_count += 1
+
+                except Exception as e:
+                    skipped_count += 1
+                    song_id = song_data.get('song_id', 'N/A')
+                    error_msg = f"Row {index + 1} (song_id: {song_id}): Error processing - {e}"
+                    errors.append(error_msg)
+                    logger.error("Error processing row %d from JSON: %s", index + 1, e, exc_info=True)
+
+            update_fields = list(FIELD_DEFAULTS.keys())
+
+            try:
+                with transaction.atomic():
+                    if connection.vendor == 'postgresql' and validated_songs and _pg_copy_upsert(validated_songs):
+                        logger.info("COPY upsert from JSON upload: %d rows staged.", len(validated_songs))
+                    else:
+                        existing_songs = Song.objects.in_bulk(list(validated_songs))
+
+                        songs_to_create = []
+                        songs_to_update = []
+                        for song_id, song_data in validated_songs.items():
+                            existing_song = existing_songs.get(song_id)
+                            if existing_song is None:
+                                songs_to_create.append(Song(**song_data))
+                            else:
+                                for field_name, value in song_data.items():
+                                    setattr(existing_song, field_name, value)
+                                songs_to_update.append(existing_song)
+
+                        if songs_to_create:
+                            Song.objects.bulk_create(songs_to_create, batch_size=1000, ignore_conflicts=True)
+                        if songs_to_update:
+                            Song.objects.bulk_update(songs_to_update, fields=update_fields, batch_size=1000)
+
+                        logger.info("Bulk upsert from JSON upload: %d created, %d updated.", len(songs_to_create), len(songs_to_update))
+
+            except IntegrityError as ie:
+                skipped_count += processed_count
+                processed_count = 0
+                error_msg = f"Integrity error during bulk upsert - {ie}. A NOT NULL field might be missing."
+                errors.append(error_msg)
+                logger.warning(error_msg)
+
+            if processed_count:
+                update_songs_cache_bulk(validated_songs.values())
 
             response_data = {
                 "processed_records": processed_count,
@@ -538,7 +722,7 @@ class JsonUploadAPIView(APIView):
                 "data": response_data
             })
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, orjson.JSONDecodeError):
             return Response({
                 "status": "error",
                 "data": {
@@ -546,7 +730,7 @@ class JsonUploadAPIView(APIView):
                 }
             }, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            logging.error(f"Error processing JSON file: {e}", exc_info=True)
+            logger.error("Error processing JSON file: %s", e, exc_info=True)
             return Response({
                 "status": "error",
                 "data": {
@@ -1,4 +1,7 @@
+import os
 from pathlib import Path
+
+from celery.schedules import crontab
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = 'django-insecure-9o-#eh#0+5f0@fvstwe$=dpu-8d8cjijwnj1pk%)&_z+s*0-!#'
@@ -79,5 +82,37 @@ USE_I18N = True
 USE_TZ = True
 
 STATIC_URL = 'static/'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'standard',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'INFO',
+    },
+}
+
+CELERY_BROKER_URL = os.environ.get(
+    'CELERY_BROKER_URL',
+    f"redis://{os.environ.get('REDIS_HOST', 'localhost')}:{os.environ.get('REDIS_PORT', '6379')}/{os.environ.get('REDIS_DB', '0')}"
+)
+
+CELERY_BEAT_SCHEDULE = {
+    'nightly-song-cache-rebuild': {
+        'task': 'api.tasks.rebuild_song_cache',
+        'schedule': crontab(hour=3, minute=0),
+    },
+}
  
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'